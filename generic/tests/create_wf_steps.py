@@ -46,14 +46,7 @@ workflow_id=json_response['data']['id']
 
 for x in range(steps_total):
   print('adding step '+str(x)+' Workflow '+ workflow_name +'...')
-  payload_string = '{"data":{"type":"workflowstep","attributes":{"sort":0,"type":"execute","options":{"command":"echo test '+str(x)+'"},"timeout":3600,"wait":true},"relationships":{"workflow":{"data":{"type":"workflow","id":"'+ workflow_id +'"}}}}}' 
-  payload_json = json.loads(payload_string)
-  payload = json.dumps(payload_json)
-  headers = {
-    'Authorization': "Bearer " + token,
-    'Content-Type': 'application/json',
-    'Accept': 'application/json'
-  }
+  payload = json.dumps({"data":{"type":"workflowstep","attributes":{"sort":0,"type":"execute","options":{"command":"echo test "+str(x)},"timeout":3600,"wait":True},"relationships":{"workflow":{"data":{"type":"workflow","id":workflow_id}}}}})
   conn.request("POST", "/v1/workflowsteps", payload, headers)
   res = conn.getresponse()
   data = res.read()